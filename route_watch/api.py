@@ -1,25 +1,147 @@
 """API abstraction layer for traffic services."""
 
+import asyncio
+import math
 import os
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from array import array
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, Union
 
 import httpx
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ConfigDict, computed_field, model_validator
+
+from route_watch.polyline import (
+    decode_polyline,
+    decode_polyline_arrays,
+    encode_polyline,
+    join_polylines,
+    polyline_length,
+)
+
+
+@lru_cache(maxsize=256)
+def _mapbox_coordinates(points: Tuple[Tuple[float, float], ...]) -> str:
+    """Format (lat, lng) points as Mapbox's semicolon-separated lng,lat list.
+    
+    Monitored routes send the same waypoints on every check, so the
+    formatted string is memoized; hashing the points is far cheaper than
+    formatting hundreds of floats.
+    """
+    return ";".join([f"{lng},{lat}" for lat, lng in points])
+
+
+@lru_cache(maxsize=256)
+def _google_waypoints(points: Tuple[Tuple[float, float], ...]) -> str:
+    """Format (lat, lng) points as Google's pipe-separated lat,lng list."""
+    return "|".join([f"{lat},{lng}" for lat, lng in points])
+
+
+# Geometries longer than this (roughly 500+ points) are decoded in a worker
+# thread so long decodes don't stall other in-flight requests
+_THREADED_DECODE_MIN_LENGTH = 4096
+
+
+async def _decode_geometry(encoded: str) -> List[Tuple[float, float]]:
+    """Decode a polyline6 geometry, off the event loop if it is long."""
+    if len(encoded) < _THREADED_DECODE_MIN_LENGTH:
+        return decode_polyline(encoded)
+    return await asyncio.to_thread(decode_polyline, encoded)
+
+
+async def _join_geometries(parts: List[str]) -> str:
+    """Join chunk geometries end to end, off the event loop if they are long."""
+    if sum(map(len, parts)) < _THREADED_DECODE_MIN_LENGTH:
+        return join_polylines(parts)
+    return await asyncio.to_thread(join_polylines, parts)
+
+
+@lru_cache(maxsize=256)
+def _straight_line_geometry(start: Tuple[float, float], end: Tuple[float, float]) -> str:
+    """Encode the two-point geometry used when a provider returns no shape."""
+    return encode_polyline((start, end))
+
+
+_RouteResponseT = TypeVar("_RouteResponseT", bound="RouteResponse")
+
+# Cached properties holding geometry decoded from route_geometry
+_DECODED_GEOMETRY_ATTRS = ("coordinates", "waypoints")
 
 
 class RouteResponse(BaseModel):
-    """Response from a route API call."""
+    """Response from a route API call.
+    
+    The route shape is kept as a compact encoded polyline; ``waypoints`` is
+    only decoded when first accessed, so callers that just need the travel
+    time or distance never pay for it.
+    
+    Providers build responses with ``model_construct``: every field is
+    computed internally, so re-validating it would be wasted work.
+    
+    Responses are frozen so the decoded ``coordinates`` and ``waypoints``
+    can't go stale; use ``model_copy(update=...)`` for a changed copy.
+    """
+    
+    model_config = ConfigDict(frozen=True)
     
     travel_time_minutes: float
     distance_km: float
-    waypoints: List[Tuple[float, float]]
-    route_geometry: Optional[str] = None
+    route_geometry: Optional[str] = None  # encoded polyline (precision 6)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _encode_waypoints(cls, data: Any) -> Any:
+        """Accept a ``waypoints`` list, encoding it as the route geometry."""
+        if isinstance(data, dict) and "waypoints" in data:
+            data = dict(data)
+            waypoints = data.pop("waypoints")
+            if waypoints and data.get("route_geometry") is None:
+                data["route_geometry"] = encode_polyline(waypoints)
+        return data
+    
+    def model_copy(
+        self: _RouteResponseT,
+        *,
+        update: Optional[Mapping[str, Any]] = None,
+        deep: bool = False
+    ) -> _RouteResponseT:
+        """Copy the response, dropping geometry decoded from the original."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _DECODED_GEOMETRY_ATTRS:
+            copied.__dict__.pop(name, None)
+        return copied
+    
+    @cached_property
+    def coordinates(self) -> Tuple[array, array]:
+        """Route points as packed (latitudes, longitudes) float64 arrays.
+        
+        Derived from ``route_geometry`` on first access and cached; treat the
+        arrays as read-only.
+        """
+        if not self.route_geometry:
+            return array("d"), array("d")
+        return decode_polyline_arrays(self.route_geometry)
+    
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def waypoints(self) -> List[Tuple[float, float]]:
+        """Waypoints along the route as (lat, lng) tuples."""
+        return list(zip(*self.coordinates))
 
 
 class TrafficAPI(ABC):
     """Abstract base class for traffic API providers."""
     
+    free_flow_cache_size = 10_000
+    
+    def __init__(self, free_flow_cache_ttl: float = 86400, batch_max_concurrency: int = 16):
+        self.free_flow_cache_ttl = free_flow_cache_ttl
+        self.batch_max_concurrency = batch_max_concurrency
+        self._free_flow_cache: Dict[Tuple[float, float, float, float], Tuple[RouteResponse, float]] = {}
+    
     @abstractmethod
     async def get_route(
         self,
@@ -31,22 +153,118 @@ class TrafficAPI(ABC):
         """Get route information between two points."""
         pass
 
-    @abstractmethod
     async def get_optimal_route(
         self,
         start: Tuple[float, float],
         end: Tuple[float, float]
     ) -> RouteResponse:
-        """Get the optimal route without traffic considerations."""
+        """Get the optimal route without traffic considerations.
+        
+        Free-flow routes change on the order of months, so responses are
+        cached for ``free_flow_cache_ttl`` seconds, keyed on the endpoints
+        rounded to 5 decimal places (about 1 m).
+        """
+        key = (round(start[0], 5), round(start[1], 5), round(end[0], 5), round(end[1], 5))
+        now = time.monotonic()
+        
+        cached = self._free_flow_cache.get(key)
+        if cached and now - cached[1] < self.free_flow_cache_ttl:
+            return cached[0]
+        
+        response = await self.get_route(start, end, avoid_traffic=True)
+        
+        # Re-insert refreshed keys at the end so dict order stays age order
+        self._free_flow_cache.pop(key, None)
+        if len(self._free_flow_cache) >= self.free_flow_cache_size:
+            # Evict the oldest entry to bound memory
+            del self._free_flow_cache[next(iter(self._free_flow_cache))]
+        self._free_flow_cache[key] = (response, now)
+        return response
+
+    async def get_routes_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Union[RouteResponse, BaseException]]:
+        """Get several routes concurrently.
+        
+        Args:
+            requests: Keyword arguments for ``get_route``, one dict per route
+            max_concurrency: Maximum number of requests in flight at once
+                (default: ``batch_max_concurrency``)
+            
+        Returns:
+            Responses in request order; failed requests yield their exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.batch_max_concurrency)
+        
+        async def one(request: Dict[str, Any]) -> RouteResponse:
+            async with semaphore:
+                return await self.get_route(**request)
+        
+        return await asyncio.gather(*[one(request) for request in requests], return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Release any resources held by the client."""
         pass
 
+    async def __aenter__(self) -> "TrafficAPI":
+        return self
 
-class MapboxAPI(TrafficAPI):
-    """Mapbox Directions API implementation."""
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+class HTTPTrafficAPI(TrafficAPI):
+    """Base class for providers backed by a long-lived HTTP client.
+    
+    The client is created lazily on first use so that it is bound to the
+    running event loop, and reused afterwards so connections are kept alive
+    between requests. With HTTP/2 enabled, concurrent requests (chunks and
+    batches) are multiplexed over a single connection. Call ``aclose``
+    before the event loop shuts down.
+    """
+    
+    base_url: str
     
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        max_keepalive_connections: int = 20,
+        http2: bool = True,
+        **kwargs: Any
+    ):
+        super().__init__(**kwargs)
         self.api_key = api_key
-        self.base_url = "https://api.mapbox.com/directions/v5/mapbox"
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http2 = http2
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[RouteResponse]"] = {}
+    
+    @classmethod
+    def options_from_config(cls, api_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract constructor keyword arguments from the API configuration."""
+        return {
+            "max_keepalive_connections": api_config.get("max_keepalive_connections", 20),
+            "http2": api_config.get("http2", True),
+            "free_flow_cache_ttl": api_config.get("free_flow_cache_ttl", 86400),
+            "batch_max_concurrency": api_config.get("batch_max_concurrency", 16)
+        }
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it if needed."""
+        if self._client is None:
+            # httpx's default Accept-Encoding already offers every encoding
+            # it can decode (br and zstd too when their decoders are installed)
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=30
+                )
+            )
+        return self._client
     
     async def get_route(
         self,
@@ -54,6 +272,98 @@ class MapboxAPI(TrafficAPI):
         end: Tuple[float, float],
         waypoints: Optional[List[Tuple[float, float]]] = None,
         avoid_traffic: bool = False
+    ) -> RouteResponse:
+        """Get route information between two points.
+        
+        Identical requests that are already in flight are coalesced: later
+        callers await the first caller's request instead of sending their own.
+        """
+        key = (start, end, tuple(waypoints or ()), avoid_traffic)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request_route(start, end, waypoints, avoid_traffic))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so a cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(future)
+    
+    @abstractmethod
+    async def _request_route(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        waypoints: Optional[List[Tuple[float, float]]] = None,
+        avoid_traffic: bool = False
+    ) -> RouteResponse:
+        """Request a route from the provider."""
+        pass
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class MapboxAPI(HTTPTrafficAPI):
+    """Mapbox Directions API implementation."""
+    
+    base_url = "https://api.mapbox.com/directions/v5/mapbox"
+    
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = 4,
+        overview: str = "simplified",
+        **kwargs: Any
+    ):
+        super().__init__(api_key, **kwargs)
+        self.max_concurrency = max_concurrency
+        # "simplified" returns a coarse geometry that is plenty for ETAs and
+        # display; "full" returns every road vertex at ~5-10x the payload
+        self.overview = overview
+        # Query parameters are identical for every request
+        self._static_params = {
+            "access_token": api_key,
+            "geometries": "polyline6",
+            "overview": overview,
+            "steps": "false"
+        }
+    
+    @classmethod
+    def options_from_config(cls, api_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract constructor keyword arguments from the API configuration."""
+        return {
+            **super().options_from_config(api_config),
+            "max_concurrency": api_config.get("max_concurrency", 4),
+            "overview": api_config.get("mapbox_overview", "simplified")
+        }
+    
+    async def _fetch_route(
+        self,
+        profile: str,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        waypoints: Optional[List[Tuple[float, float]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Request a single route and return the first route object, if any."""
+        coordinates = _mapbox_coordinates((start, *(waypoints or ()), end))
+        url = f"/{profile}/{coordinates}"
+        
+        response = await self._get_client().get(url, params=self._static_params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        if not data.get("routes"):
+            return None
+        return data["routes"][0]
+    
+    async def _request_route(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        waypoints: Optional[List[Tuple[float, float]]] = None,
+        avoid_traffic: bool = False
     ) -> RouteResponse:
         """Get route from Mapbox Directions API."""
         profile = "driving-traffic" if not avoid_traffic else "driving"
@@ -62,46 +372,22 @@ class MapboxAPI(TrafficAPI):
         if waypoints and len(waypoints) > 23:  # 23 = 25 total - start - end
             return await self._get_route_chunked(start, end, waypoints, avoid_traffic)
         
-        # Format coordinates as lng,lat for Mapbox
-        coords = [f"{start[1]},{start[0]}"]
-        if waypoints:
-            coords.extend([f"{wp[1]},{wp[0]}" for wp in waypoints])
-        coords.append(f"{end[1]},{end[0]}")
-        
-        coordinates = ";".join(coords)
-        url = f"{self.base_url}/{profile}/{coordinates}"
-        
-        params = {
-            "access_token": self.api_key,
-            "geometries": "geojson",
-            "overview": "full",
-            "steps": "false"
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-        
-        if not data.get("routes"):
+        route = await self._fetch_route(profile, start, end, waypoints)
+        if route is None:
             raise ValueError("No routes found")
         
-        route = data["routes"][0]
         duration_seconds = route["duration"]
         distance_meters = route["distance"]
-        
-        # Extract waypoints from geometry
-        geometry = route["geometry"]["coordinates"]
-        route_waypoints = [(lat, lng) for lng, lat in geometry]
+        geometry = route["geometry"]
 
-        if len(route_waypoints) > 23:  # 23 = 25 total - start - end
+        if polyline_length(geometry) > 23:  # 23 = 25 total - start - end
+            route_waypoints = await _decode_geometry(geometry)
             return await self._get_route_chunked(start, end, route_waypoints, avoid_traffic)
         
-        return RouteResponse(
+        return RouteResponse.model_construct(
             travel_time_minutes=duration_seconds / 60,
             distance_km=distance_meters / 1000,
-            waypoints=route_waypoints,
-            route_geometry=str(route["geometry"])
+            route_geometry=geometry
         )
     
     async def _get_route_chunked(
@@ -111,90 +397,72 @@ class MapboxAPI(TrafficAPI):
         waypoints: List[Tuple[float, float]],
         avoid_traffic: bool = False
     ) -> RouteResponse:
-        """Get route with waypoint chunking for Mapbox's 25-waypoint limit."""
+        """Get route with waypoint chunking for Mapbox's 25-waypoint limit.
+        
+        Chunk boundaries depend only on the input waypoints, so all chunks
+        are requested concurrently (bounded by ``max_concurrency``).
+        """
         profile = "driving-traffic" if not avoid_traffic else "driving"
         
         # Chunk waypoints into groups of 23 (25 total - start - end)
         chunk_size = 23
         chunks = [waypoints[i:i + chunk_size] for i in range(0, len(waypoints), chunk_size)]
         
-        total_duration = 0
-        total_distance = 0
-        all_route_waypoints = []
-        
+        # Precompute (start, end, waypoints) for every chunk. Each chunk ends at
+        # its last waypoint, which becomes the start of the next chunk; the last
+        # chunk ends at the original end point.
+        segments = []
         current_start = start
-        
         for i, chunk in enumerate(chunks):
-            # For the last chunk, use the original end point
-            current_end = end if i == len(chunks) - 1 else chunk[-1]
-            current_waypoints = chunk if i == len(chunks) - 1 else chunk[:-1]
-            
-            # Format coordinates as lng,lat for Mapbox
-            coords = [f"{current_start[1]},{current_start[0]}"]
-            if current_waypoints:
-                coords.extend([f"{wp[1]},{wp[0]}" for wp in current_waypoints])
-            coords.append(f"{current_end[1]},{current_end[0]}")
-            
-            coordinates = ";".join(coords)
-            url = f"{self.base_url}/{profile}/{coordinates}"
-            
-            params = {
-                "access_token": self.api_key,
-                "geometries": "geojson",
-                "overview": "full",
-                "steps": "false"
-            }
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-            
-            if not data.get("routes"):
+            if i == len(chunks) - 1:
+                segments.append((current_start, end, chunk))
+            else:
+                segments.append((current_start, chunk[-1], chunk[:-1]))
+                current_start = chunk[-1]
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(
+            segment: Tuple[Tuple[float, float], Tuple[float, float], List[Tuple[float, float]]]
+        ) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_route(profile, *segment)
+        
+        routes = await asyncio.gather(*[fetch(segment) for segment in segments])
+        
+        total_duration = 0.0
+        total_distance = 0.0
+        geometries = []
+        
+        for i, route in enumerate(routes):
+            if route is None:
                 raise ValueError(f"No routes found for chunk {i + 1}")
             
-            route = data["routes"][0]
             total_duration += route["duration"]
             total_distance += route["distance"]
-            
-            # Extract waypoints from geometry
-            geometry = route["geometry"]["coordinates"]
-            chunk_waypoints = [(lat, lng) for lng, lat in geometry]
-            
-            # Avoid duplicating waypoints between chunks
-            if i > 0 and all_route_waypoints and chunk_waypoints:
-                # Remove first waypoint of current chunk as it's the same as last of previous
-                chunk_waypoints = chunk_waypoints[1:]
-            
-            all_route_waypoints.extend(chunk_waypoints)
-            
-            # Set start for next chunk
-            current_start = current_end
+            geometries.append(route["geometry"])
+        
+        # Splice the encoded chunk geometries, dropping the point each chunk
+        # shares with the previous one, instead of decoding and re-encoding
+        geometry = await _join_geometries(geometries)
         
-        return RouteResponse(
+        return RouteResponse.model_construct(
             travel_time_minutes=total_duration / 60,
             distance_km=total_distance / 1000,
-            waypoints=all_route_waypoints,
-            route_geometry=None  # Can't combine geometries easily
+            route_geometry=geometry
         )
-    
-    async def get_optimal_route(
-        self,
-        start: Tuple[float, float],
-        end: Tuple[float, float]
-    ) -> RouteResponse:
-        """Get optimal route without traffic considerations."""
-        return await self.get_route(start, end, avoid_traffic=True)
 
 
-class GoogleMapsAPI(TrafficAPI):
+class GoogleMapsAPI(HTTPTrafficAPI):
     """Google Maps Directions API implementation."""
     
-    def __init__(self, api_key: str):
-        self.api_key = api_key
-        self.base_url = "https://maps.googleapis.com/maps/api/directions"
+    base_url = "https://maps.googleapis.com/maps/api/directions"
     
-    async def get_route(
+    def __init__(self, api_key: str, **kwargs: Any):
+        super().__init__(api_key, **kwargs)
+        self._static_params = {"key": api_key, "units": "metric"}
+    
+    async def _request_route(
         self,
         start: Tuple[float, float],
         end: Tuple[float, float],
@@ -203,25 +471,20 @@ class GoogleMapsAPI(TrafficAPI):
     ) -> RouteResponse:
         """Get route from Google Maps Directions API."""
         params = {
+            **self._static_params,
             "origin": f"{start[0]},{start[1]}",
-            "destination": f"{end[0]},{end[1]}",
-            "key": self.api_key,
-            "units": "metric"
+            "destination": f"{end[0]},{end[1]}"
         }
         
         if waypoints:
-            waypoint_str = "|".join([f"{wp[0]},{wp[1]}" for wp in waypoints])
-            params["waypoints"] = waypoint_str
+            params["waypoints"] = _google_waypoints(tuple(waypoints))
         
         if not avoid_traffic:
             params["departure_time"] = "now"
         
-        url = f"{self.base_url}/json"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._get_client().get("/json", params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
         if data["status"] != "OK" or not data.get("routes"):
             raise ValueError(f"Google Maps API error: {data.get('status', 'No routes found')}")
@@ -239,29 +502,28 @@ class GoogleMapsAPI(TrafficAPI):
         
         # Extract waypoints from overview_polyline
         # This is a simplified extraction - in practice, you'd decode the polyline
-        route_waypoints = [start, end]
-        
-        return RouteResponse(
+        return RouteResponse.model_construct(
             travel_time_minutes=duration_seconds / 60,
             distance_km=distance_meters / 1000,
-            waypoints=route_waypoints
+            route_geometry=_straight_line_geometry(start, end)
         )
-    
-    async def get_optimal_route(
-        self,
-        start: Tuple[float, float],
-        end: Tuple[float, float]
-    ) -> RouteResponse:
-        """Get optimal route without traffic considerations."""
-        return await self.get_route(start, end, avoid_traffic=True)
 
 
 class MockAPI(TrafficAPI):
     """Mock API for testing purposes."""
     
-    def __init__(self, **kwargs):
-        self.base_travel_time = 30  # minutes
+    max_fake_waypoints = 3
+    # Fractions along the route for 1..max_fake_waypoints intermediate points
+    _waypoint_ratios = {
+        n: tuple(i / (n + 1) for i in range(1, n + 1))
+        for n in range(1, max_fake_waypoints + 1)
+    }
+    
+    def __init__(self, free_flow_cache_ttl: float = 86400, batch_max_concurrency: int = 16, **kwargs):
+        super().__init__(free_flow_cache_ttl, batch_max_concurrency)
+        self.base_travel_time = 30.0  # minutes
         self.traffic_multiplier = 1.5
+        self._rng = random.Random()
     
     async def get_route(
         self,
@@ -272,11 +534,7 @@ class MockAPI(TrafficAPI):
     ) -> RouteResponse:
         """Get mock route data."""
         # Calculate simple distance-based travel time
-        import math
-        
-        lat_diff = end[0] - start[0]
-        lng_diff = end[1] - start[1]
-        distance_km = math.sqrt(lat_diff**2 + lng_diff**2) * 111  # Rough km conversion
+        distance_km = math.hypot(end[0] - start[0], end[1] - start[1]) * 111  # Rough km conversion
         
         base_time = max(self.base_travel_time, distance_km * 2)  # 2 min per km base
         
@@ -293,32 +551,33 @@ class MockAPI(TrafficAPI):
             # This is useful for testing the populate-free-flow functionality
             if avoid_traffic and distance_km > 1:  # Generate waypoints for routes > 1km
                 # Generate 1-3 intermediate waypoints based on distance
-                num_points = min(3, max(1, int(distance_km / 2)))
-                for i in range(1, num_points + 1):
-                    ratio = i / (num_points + 1)
-                    intermediate_lat = start[0] + ratio * (end[0] - start[0])
-                    intermediate_lng = start[1] + ratio * (end[1] - start[1])
-                    # Add small random offset to simulate real route
-                    import random
-                    intermediate_lat += random.uniform(-0.001, 0.001)
-                    intermediate_lng += random.uniform(-0.001, 0.001)
-                    route_waypoints.append((intermediate_lat, intermediate_lng))
+                num_points = min(self.max_fake_waypoints, max(1, int(distance_km / 2)))
+                lat_span = end[0] - start[0]
+                lng_span = end[1] - start[1]
+                uniform = self._rng.uniform
+                # Add small random offset to simulate real route
+                route_waypoints.extend([
+                    (
+                        start[0] + ratio * lat_span + uniform(-0.001, 0.001),
+                        start[1] + ratio * lng_span + uniform(-0.001, 0.001)
+                    )
+                    for ratio in self._waypoint_ratios[num_points]
+                ])
         
         route_waypoints.append(end)
         
-        return RouteResponse(
+        return RouteResponse.model_construct(
             travel_time_minutes=travel_time,
             distance_km=distance_km,
-            waypoints=route_waypoints
+            route_geometry=encode_polyline(route_waypoints)
         )
-    
-    async def get_optimal_route(
-        self,
-        start: Tuple[float, float],
-        end: Tuple[float, float]
-    ) -> RouteResponse:
-        """Get optimal mock route without traffic."""
-        return await self.get_route(start, end, avoid_traffic=True)
+
+
+# Provider name -> (client class, API key environment variable, display name)
+_HTTP_PROVIDERS: Dict[str, Tuple[Type[HTTPTrafficAPI], str, str]] = {
+    "mapbox": (MapboxAPI, "MAPBOX_API_KEY", "Mapbox"),
+    "google": (GoogleMapsAPI, "GOOGLE_MAPS_API_KEY", "Google Maps"),
+}
 
 
 def create_api_client(api_config: Dict[str, Any]) -> TrafficAPI:
@@ -334,20 +593,14 @@ def create_api_client(api_config: Dict[str, Any]) -> TrafficAPI:
     
     provider = provider.lower()
     
-    if provider == "mapbox":
-        api_key = api_config.get("api_key") or os.getenv("MAPBOX_API_KEY")
-        if not api_key:
-            raise ValueError("Mapbox API key not found in config or MAPBOX_API_KEY environment variable")
-        return MapboxAPI(api_key)
-    
-    elif provider == "google":
-        api_key = api_config.get("api_key") or os.getenv("GOOGLE_MAPS_API_KEY")
-        if not api_key:
-            raise ValueError("Google Maps API key not found in config or GOOGLE_MAPS_API_KEY environment variable")
-        return GoogleMapsAPI(api_key)
-    
-    elif provider == "mock":
+    if provider == "mock":
         return MockAPI(**api_config)
     
-    else:
-        raise ValueError(f"Unsupported API provider: {provider}")
\ No newline at end of file
+    if provider not in _HTTP_PROVIDERS:
+        raise ValueError(f"Unsupported API provider: {provider}")
+    
+    api_class, key_env_var, label = _HTTP_PROVIDERS[provider]
+    api_key = api_config.get("api_key") or os.getenv(key_env_var)
+    if not api_key:
+        raise ValueError(f"{label} API key not found in config or {key_env_var} environment variable")
+    return api_class(api_key, **api_class.options_from_config(api_config))
@@ -2,14 +2,18 @@
 
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Set
 
 import click
-from dotenv import load_dotenv
 
-from route_watch.config import Config
-from route_watch.core import RouteMonitor
-from route_watch.notifications import NotificationService
+# Commands import the config, API and notification stacks (pydantic, httpx,
+# dotenv) when they run, so --help and version stay fast
+if TYPE_CHECKING:
+    import asyncio
+    
+    from route_watch.config import RouteConfig
+    from route_watch.core import RouteMonitor
+    from route_watch.notifications import NotificationService
 
 
 @click.group(invoke_without_command=True)
@@ -45,6 +49,12 @@ def cli(ctx: click.Context, version: bool) -> None:
 )
 def check(config_file: Path, route: str, verbose: bool) -> None:
     """Run a one-time congestion check for a specific route."""
+    from dotenv import load_dotenv
+    
+    from route_watch.config import Config
+    from route_watch.core import RouteMonitor
+    from route_watch.notifications import NotificationService
+    
     load_dotenv()
     
     try:
@@ -116,6 +126,11 @@ def check(config_file: Path, route: str, verbose: bool) -> None:
 )
 def populate_free_flow(config_file: Path, route: str, save: bool) -> None:
     """Populate free-flow route waypoints for a specific route."""
+    from dotenv import load_dotenv
+    
+    from route_watch.config import Config
+    from route_watch.core import RouteMonitor
+    
     load_dotenv()
     
     try:
@@ -190,31 +205,84 @@ def populate_free_flow(config_file: Path, route: str, save: bool) -> None:
 )
 def watch(config_file: Path, route: Optional[str], interval: int, verbose: bool) -> None:
     """Continuously monitor routes for congestion."""
+    import asyncio
+    
+    from dotenv import load_dotenv
+    
+    from route_watch.config import Config
+    from route_watch.core import RouteMonitor
+    from route_watch.notifications import NotificationService
+    
     load_dotenv()
     
     try:
-        import time
-        
         config = Config.load_from_file(config_file)
         monitor = RouteMonitor(config.api_config)
         notification_service = NotificationService(config.notification) if config.notification else None
         
         routes_to_watch = [route] if route else list(config.routes.keys())
+        route_configs = [config.get_route(route_name) for route_name in routes_to_watch]
         
         click.echo("🔍 Starting route monitoring...")
         click.echo(f"Routes: {', '.join(routes_to_watch)}")
         click.echo(f"Check interval: {interval} seconds")
         click.echo("Press Ctrl+C to stop")
         
-        while True:
-            try:
-                for route_name in routes_to_watch:
-                    route_config = config.get_route(route_name)
-                    
-                    if verbose:
+        try:
+            asyncio.run(_watch_async(monitor, route_configs, notification_service, interval, verbose))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            click.echo("\n👋 Stopping route monitoring...")
+        
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+async def _watch_async(
+    monitor: "RouteMonitor",
+    route_configs: List["RouteConfig"],
+    notification_service: Optional["NotificationService"],
+    interval: int,
+    verbose: bool
+) -> None:
+    """Monitor routes in a single event loop, reusing the API client's connections."""
+    import asyncio
+    import signal
+    
+    # Cancel the loop on Ctrl+C so an in-progress sleep or check stops
+    # immediately; watch() reports the cancellation as a normal stop
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    assert main_task is not None
+    try:
+        loop.add_signal_handler(signal.SIGINT, main_task.cancel)
+    except NotImplementedError:
+        # Not supported on Windows, where asyncio.run raises KeyboardInterrupt instead
+        pass
+    
+    # Notifications run in the background so a slow notifier doesn't delay
+    # the next check; keep references so the tasks aren't garbage collected
+    notification_tasks: Set["asyncio.Task[None]"] = set()
+    
+    async def notify(service: "NotificationService", message: str) -> None:
+        await service.send_notification_async(message)
+        click.echo("📱 Notification sent")
+    
+    async with monitor.api_client:
+        try:
+            while True:
+                if verbose:
+                    for route_config in route_configs:
                         click.echo(f"Checking {route_config.name}...")
-                    
-                    result = monitor.check_route_congestion(route_config)
+                
+                # Check all routes concurrently
+                results = await monitor.check_routes_async(route_configs)
+                
+                for route_config, result in zip(route_configs, results):
+                    if isinstance(result, BaseException):
+                        # Report the failure but keep monitoring the other routes
+                        click.echo(f"Error checking route {route_config.name}: {result}", err=True)
+                        continue
                     
                     if result.is_congested and result.alternative_available:
                         message = (
@@ -226,18 +294,15 @@ def watch(config_file: Path, route: Optional[str], interval: int, verbose: bool)
                         click.echo(f"⚠️  {message}")
                         
                         if notification_service:
-                            notification_service.send_notification(message)
-                            click.echo("📱 Notification sent")
+                            notification_task = asyncio.create_task(notify(notification_service, message))
+                            notification_tasks.add(notification_task)
+                            notification_task.add_done_callback(notification_tasks.discard)
                 
-                time.sleep(interval)
-                
-            except KeyboardInterrupt:
-                click.echo("\n👋 Stopping route monitoring...")
-                break
-        
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+                await asyncio.sleep(interval)
+        finally:
+            # Let notifications that are still running finish before exiting
+            if notification_tasks:
+                await asyncio.gather(*notification_tasks, return_exceptions=True)
 
 
 @cli.command('test-notification')
@@ -249,6 +314,11 @@ def watch(config_file: Path, route: Optional[str], interval: int, verbose: bool)
 )
 def test_notification(config_file: Path) -> None:
     """Test the notification system with a sample message."""
+    from dotenv import load_dotenv
+    
+    from route_watch.config import Config
+    from route_watch.notifications import NotificationService
+    
     load_dotenv()
     
     try:
@@ -1,13 +1,97 @@
 """Configuration models and loading for route_watch."""
 
+import hashlib
 import json
+import math
 import os
+import re
+import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import toml
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_validator
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+# Prefer libyaml's C loader and dumper; fall back to the pure-Python ones
+try:
+    from yaml import CSafeDumper as YAMLDumper
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as YAMLDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
+
+# A TOML table header or "key = value" line
+_TOML_LINE_RE = re.compile(r'^(\[|[\w"\'.-]+\s*=)')
+
+
+def _sniff_format(content: str) -> str:
+    """Guess whether config content is JSON, YAML, or TOML from its first line.
+    
+    Blank lines and comments are skipped. JSON configs open with ``{``,
+    YAML documents may open with ``---`` or ``%YAML``, and TOML lines are
+    table headers or ``key = value`` pairs; anything else (``key: value``)
+    is treated as YAML.
+    """
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            return "json"
+        if line.startswith(("---", "%YAML")):
+            return "yaml"
+        if _TOML_LINE_RE.match(line):
+            return "toml"
+        return "yaml"
+    return "toml"
+
+
+def _config_cache_file(path: Path, content: str) -> Optional[Path]:
+    """Return the parsed-config cache file for this content, if caching is enabled.
+    
+    Caching is opt-in via ``ROUTE_WATCH_CONFIG_CACHE=1``. Entries are keyed on
+    a hash of the file content, its suffix (which selects the parser) and the
+    package version, so edits and upgrades invalidate them automatically.
+    """
+    if os.getenv("ROUTE_WATCH_CONFIG_CACHE") != "1":
+        return None
+    
+    from route_watch import __version__
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (__version__, path.suffix.lower(), content):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    
+    cache_dir = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "route_watch"
+    return cache_dir / f"{digest.hexdigest()}.json"
+
+
+def _write_config_cache(cache_file: Path, data: str) -> None:
+    """Atomically write a parsed-config cache entry, ignoring failures."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as tmp:
+            tmp.write(data)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        # The cache is only an optimization
+        pass
+
+
+# Below this many waypoints the plain per-point loop is faster than the
+# min/max range check (the 20 that populate-free-flow writes included)
+_FAST_WAYPOINT_CHECK_MIN = 32
 
 
 class RouteConfig(BaseModel):
@@ -42,6 +126,18 @@ class RouteConfig(BaseModel):
     @classmethod
     def validate_waypoints(cls, v: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
         """Validate waypoint coordinates."""
+        if len(v) > _FAST_WAYPOINT_CHECK_MIN:
+            # Fast path: range-check each axis with C-level min/max. min/max
+            # can miss NaN, but a NaN anywhere makes the sum NaN.
+            lats, lngs = zip(*v)
+            if (
+                -90 <= min(lats) and max(lats) <= 90
+                and -180 <= min(lngs) and max(lngs) <= 180
+                and not math.isnan(sum(lats) + sum(lngs))
+            ):
+                return v
+        
+        # Slow path: find the offending waypoint for the error message
         for waypoint in v:
             if len(waypoint) != 2:
                 raise ValueError("Each waypoint must be a tuple of (lat, lng)")
@@ -53,27 +149,69 @@ class RouteConfig(BaseModel):
         return v
 
 
+# Kinds of entries in a compiled notification argument template
+_ARG_LITERAL = 0
+_ARG_MESSAGE = 1
+_ARG_ENV = 2
+
+# An argument of the form <NAME> is replaced by environment variable NAME
+_ENV_PLACEHOLDER_RE = re.compile(r"<(.*)>", re.DOTALL)
+
+
 class NotificationConfig(BaseModel):
     """Configuration for notification system."""
     
     tool: str = Field(..., description="CLI tool to use for notifications")
     cli_args: List[str] = Field(..., description="Arguments to pass to the CLI tool")
+    
+    # cli_args compiled to (kind, payload) pairs, the positions of the
+    # message placeholder, and the arguments with environment variables
+    # resolved (filled in on first use)
+    _template: List[Tuple[int, str]] = PrivateAttr(default_factory=list)
+    _message_indices: Tuple[int, ...] = PrivateAttr(default=())
+    _resolved_args: Optional[List[str]] = PrivateAttr(default=None)
 
-    def get_command_args(self, message: str) -> List[str]:
-        """Replace message placeholder and expand environment variables."""
-        expanded_args = []
+    def model_post_init(self, __context: Any) -> None:
+        """Compile cli_args into an argument template."""
+        template = []
         for arg in self.cli_args:
+            env_match = _ENV_PLACEHOLDER_RE.fullmatch(arg)
             if arg == "_NOTIFICATION_MESSAGE_":
-                expanded_args.append(message)
-            elif arg.startswith("<") and arg.endswith(">"):
-                env_var = arg[1:-1]
-                env_value = os.getenv(env_var)
-                if env_value is None:
-                    raise ValueError(f"Environment variable {env_var} is not set")
-                expanded_args.append(env_value)
+                template.append((_ARG_MESSAGE, arg))
+            elif env_match:
+                template.append((_ARG_ENV, env_match.group(1)))
             else:
-                expanded_args.append(arg)
-        return expanded_args
+                template.append((_ARG_LITERAL, arg))
+        self._template = template
+        self._message_indices = tuple(
+            index for index, (kind, _) in enumerate(template) if kind == _ARG_MESSAGE
+        )
+
+    def refresh_env(self) -> None:
+        """Forget resolved environment variables so they are re-read on next use."""
+        self._resolved_args = None
+
+    def get_command_args(self, message: str) -> List[str]:
+        """Replace message placeholder and expand environment variables.
+        
+        Environment variables are read on first use and reused afterwards;
+        call ``refresh_env`` to pick up changes.
+        """
+        if self._resolved_args is None:
+            resolved_args = []
+            for kind, value in self._template:
+                if kind == _ARG_ENV:
+                    env_value = os.getenv(value)
+                    if env_value is None:
+                        raise ValueError(f"Environment variable {value} is not set")
+                    value = env_value
+                resolved_args.append(value)
+            self._resolved_args = resolved_args
+        
+        args = self._resolved_args.copy()
+        for index in self._message_indices:
+            args[index] = message
+        return args
 
 
 class Config(BaseModel):
@@ -88,55 +226,86 @@ class Config(BaseModel):
 
     @classmethod
     def load_from_file(cls, file_path: Union[str, Path]) -> "Config":
-        """Load configuration from a TOML, YAML, or JSON file."""
+        """Load configuration from a TOML, YAML, or JSON file.
+        
+        Parsed files are memoized in-process on (path, mtime, size), so
+        repeated loads of an unchanged file skip parsing. Each call still
+        returns a fresh instance that callers may modify.
+        """
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {path}")
         
+        stat = path.stat()
+        return _load_config(str(path.resolve()), stat.st_mtime_ns, stat.st_size).model_copy(deep=True)
+
+    @classmethod
+    def _parse_file(cls, path: Path) -> "Config":
+        """Read and parse a configuration file."""
         content = path.read_text()
         
+        cache_file = _config_cache_file(path, content)
+        if cache_file is not None:
+            try:
+                return cls.model_validate_json(cache_file.read_bytes())
+            except (OSError, ValueError):
+                # Missing or unreadable entry; parse the file normally
+                pass
+        
         # Determine file format and parse
         if path.suffix.lower() in ['.toml']:
-            data = toml.loads(content)
+            data = tomllib.loads(content)
         elif path.suffix.lower() in ['.yml', '.yaml']:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YAMLLoader)
         elif path.suffix.lower() in ['.json']:
             data = json.loads(content)
         else:
-            # Try to auto-detect format
+            # Unknown extension: sniff the format and parse exactly once
+            file_format = _sniff_format(content)
             try:
-                data = toml.loads(content)
-            except toml.TomlDecodeError:
-                try:
-                    data = yaml.safe_load(content)
-                except yaml.YAMLError:
-                    try:
-                        data = json.loads(content)
-                    except json.JSONDecodeError:
-                        raise ValueError(f"Unable to parse configuration file: {path}")
-        
-        # Convert route.* format to routes dict
-        routes = {}
-        notification = None
-        api_config = {}
-        
-        for key, value in data.items():
+                if file_format == "json":
+                    data = json.loads(content)
+                elif file_format == "yaml":
+                    data = yaml.load(content, Loader=YAMLLoader)
+                else:
+                    data = tomllib.loads(content)
+            except (ValueError, yaml.YAMLError):
+                raise ValueError(f"Unable to parse configuration file: {path}")
+        
+        # Partition the top-level keys once: nested [route.*] tables, dotted
+        # "route.<name>" keys, the notification table, and everything else
+        # (like provider, api_key) merged into api_config
+        data = dict(data)
+        raw_routes = dict(data.pop("route", None) or {})
+        notification_data = data.pop("notification", None)
+        api_config = dict(data.pop("api_config", None) or {})
+        
+        for key in [key for key in data if "." in key]:
             if key.startswith("route."):
-                route_name = key[6:]  # Remove "route." prefix
-                routes[route_name] = RouteConfig(**value)
-            elif key == "route":
-                # Handle nested route structure from TOML
-                for route_name, route_data in value.items():
-                    routes[route_name] = RouteConfig(**route_data)
-            elif key == "notification":
-                notification = NotificationConfig(**value)
-            elif key == "api_config":
-                api_config = value
-            else:
-                # Handle other top-level config items (like provider, api_key)
-                api_config[key] = value
+                raw_routes[key[6:]] = data.pop(key)  # Remove "route." prefix
+        api_config.update(data)
+        
+        # One validator call for all routes; errors are reported per route name
+        routes = _ROUTES_ADAPTER.validate_python(raw_routes)
+        notification = (
+            NotificationConfig.model_validate(notification_data)
+            if notification_data is not None else None
+        )
+        
+        config = cls(routes=routes, notification=notification, api_config=api_config)
         
-        return cls(routes=routes, notification=notification, api_config=api_config)
+        if cache_file is not None:
+            # Only cache configs that survive the JSON round trip unchanged
+            # (inf/nan and TOML datetimes don't)
+            config_json = config.model_dump_json()
+            try:
+                cacheable = cls.model_validate_json(config_json) == config
+            except ValueError:
+                cacheable = False
+            if cacheable:
+                _write_config_cache(cache_file, config_json)
+        
+        return config
 
     def get_route(self, route_name: str) -> RouteConfig:
         """Get a specific route configuration by name."""
@@ -148,27 +317,44 @@ class Config(BaseModel):
         """Save configuration to a file."""
         path = Path(file_path)
         
-        # Convert back to route.* format for saving
-        data = {}
+        # Convert back to route.* format for saving. JSON mode turns
+        # coordinate tuples into plain lists every format can represent.
+        data: Dict[str, Any] = {}
         
         for route_name, route_config in self.routes.items():
-            data[f"route.{route_name}"] = route_config.model_dump()
+            data[f"route.{route_name}"] = route_config.model_dump(mode="json")
         
         if self.notification:
-            data["notification"] = self.notification.model_dump()
+            data["notification"] = self.notification.model_dump(mode="json")
         
         if self.api_config:
             data.update(self.api_config)
         
-        # Save based on file extension
-        if path.suffix.lower() in ['.toml']:
-            content = toml.dumps(data)
-        elif path.suffix.lower() in ['.yml', '.yaml']:
-            content = yaml.dump(data, default_flow_style=False)
-        elif path.suffix.lower() in ['.json']:
+        # Save based on file extension. The stdlib encoder is kept for JSON
+        # because it writes inf/nan thresholds as Infinity/NaN, which load
+        # back; orjson would write them as null.
+        if path.suffix.lower() in ['.json']:
             content = json.dumps(data, indent=2)
+        elif path.suffix.lower() in ['.yml', '.yaml']:
+            content = yaml.dump(data, Dumper=YAMLDumper, default_flow_style=False)
         else:
-            # Default to TOML
+            # TOML, also the default
             content = toml.dumps(data)
         
-        path.write_text(content)
\ No newline at end of file
+        path.write_text(content)
+
+
+# Validates a whole {name: route} mapping in one pydantic-core call. The route
+# validators run Python code under the GIL, so a thread pool doesn't help here.
+_ROUTES_ADAPTER = TypeAdapter(Dict[str, RouteConfig], config=ConfigDict(title="routes"))
+
+
+@lru_cache(maxsize=32)
+def _load_config(path: str, mtime_ns: int, size: int) -> Config:
+    """Parse and validate a configuration file.
+    
+    ``mtime_ns`` and ``size`` are only part of the cache key, so editing the
+    file invalidates the memoized result. Callers must copy the returned
+    config before handing it out.
+    """
+    return Config._parse_file(Path(path))
@@ -1,13 +1,16 @@
 """Core route monitoring logic."""
 
 import asyncio
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 from pydantic import BaseModel
 
-from route_watch.api import create_api_client
 from route_watch.config import RouteConfig
 
+T = TypeVar("T")
+
 
 class CongestionResult(BaseModel):
     """Result of a congestion check."""
@@ -25,8 +28,38 @@ class CongestionResult(BaseModel):
 class RouteMonitor:
     """Main class for monitoring route congestion."""
     
+    # Alternative routes change slowly, so their travel times are reused
+    # within fixed time buckets of this many seconds
+    alternative_cache_seconds = 60
+    
     def __init__(self, api_config: Dict[str, Any]):
+        # Imported here so importing core doesn't load the HTTP stack
+        from route_watch.api import create_api_client
+        
         self.api_client = create_api_client(api_config)
+        # (start, end) -> (time bucket, travel time); only the latest bucket
+        # is kept per endpoint pair, so stale entries are replaced, not piled up
+        self._alternative_cache: Dict[Tuple[Tuple[float, float], Tuple[float, float]], Tuple[int, float]] = {}
+        # Free-flow times on a fixed route barely change, so they are refetched
+        # at most every free_flow_time_ttl seconds. This is separate from the
+        # API client's free_flow_cache_ttl, which caches optimal routes.
+        self.free_flow_time_ttl = float(api_config.get("free_flow_time_ttl", 86400))
+        # (start, end, waypoints) -> (travel time, fetched at monotonic time)
+        self._free_flow_time_cache: Dict[Tuple[Any, ...], Tuple[float, float]] = {}
+    
+    def _run(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine in a fresh event loop, closing the API client afterwards.
+        
+        The API client keeps its connection pool open between requests, but
+        the pool is bound to the event loop it was created in.
+        """
+        async def runner() -> T:
+            try:
+                return await coro
+            finally:
+                await self.api_client.aclose()
+        
+        return asyncio.run(runner())
     
     async def get_current_travel_time(self, route_config: RouteConfig) -> float:
         """Get current travel time with traffic for a route."""
@@ -42,7 +75,16 @@ class RouteMonitor:
         return response.travel_time_minutes
     
     async def get_free_flow_travel_time(self, route_config: RouteConfig) -> float:
-        """Get free-flow travel time without traffic for a route."""
+        """Get free-flow travel time without traffic for a route.
+        
+        Results are cached for ``free_flow_time_ttl`` seconds per start, end
+        and waypoints, so changing a route's waypoints fetches a fresh time.
+        """
+        key = self._free_flow_key(route_config)
+        cached = self._get_cached_free_flow_time(key)
+        if cached is not None:
+            return cached
+        
         waypoints = route_config.free_flow_route if route_config.free_flow_route else None
         
         response = await self.api_client.get_route(
@@ -52,10 +94,29 @@ class RouteMonitor:
             avoid_traffic=True
         )
         
+        self._free_flow_time_cache[key] = (response.travel_time_minutes, time.monotonic())
         return response.travel_time_minutes
     
+    @staticmethod
+    def _free_flow_key(route_config: RouteConfig) -> Tuple[Any, ...]:
+        """Cache key identifying a route's geometry."""
+        return (route_config.start_latlong, route_config.end_latlong, tuple(route_config.free_flow_route))
+    
+    def _get_cached_free_flow_time(self, key: Tuple[Any, ...]) -> Optional[float]:
+        """Return the cached free-flow time for a route if it hasn't expired."""
+        cached = self._free_flow_time_cache.get(key)
+        if cached is not None and time.monotonic() - cached[1] < self.free_flow_time_ttl:
+            return cached[0]
+        return None
+    
     async def get_alternative_travel_time(self, route_config: RouteConfig) -> float:
         """Get travel time for an alternative route without using predefined waypoints."""
+        key = (route_config.start_latlong, route_config.end_latlong)
+        bucket = int(time.time() // self.alternative_cache_seconds)
+        cached = self._alternative_cache.get(key)
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
+        
         response = await self.api_client.get_route(
             start=route_config.start_latlong,
             end=route_config.end_latlong,
@@ -63,16 +124,127 @@ class RouteMonitor:
             avoid_traffic=False
         )
         
+        self._alternative_cache[key] = (bucket, response.travel_time_minutes)
         return response.travel_time_minutes
     
     def check_route_congestion(self, route_config: RouteConfig) -> CongestionResult:
         """Check if a route is congested and if alternatives are available."""
-        return asyncio.run(self._check_route_congestion_async(route_config))
+        return self._run(self._check_route_congestion_async(route_config))
     
-    async def _check_route_congestion_async(self, route_config: RouteConfig) -> CongestionResult:
-        """Async implementation of congestion checking."""
-        from datetime import datetime
+    def check_routes(
+        self,
+        route_configs: List[RouteConfig]
+    ) -> List[Union[CongestionResult, BaseException]]:
+        """Check several routes concurrently.
+        
+        Returns:
+            Results in route order; routes whose check failed yield the exception
+        """
+        return self._run(self.check_routes_async(route_configs))
+    
+    async def check_routes_async(
+        self,
+        route_configs: List[RouteConfig]
+    ) -> List[Union[CongestionResult, BaseException]]:
+        """Check several routes concurrently within the running event loop.
+        
+        Long-running callers should use this inside ``async with
+        monitor.api_client:`` so the HTTP connection pool stays open between
+        checks. Routes that differ only by name are checked once and the
+        result is relabeled for each of them, and the current and free-flow
+        requests for all routes go out as one ``get_routes_batch`` call.
+        """
+        keys = [
+            (
+                route_config.start_latlong,
+                route_config.end_latlong,
+                tuple(route_config.free_flow_route),
+                route_config.congestion_threshold,
+            )
+            for route_config in route_configs
+        ]
+        unique: Dict[Tuple[Any, ...], RouteConfig] = {}
+        for key, route_config in zip(keys, route_configs):
+            unique.setdefault(key, route_config)
         
+        # One timestamp per tick, shared by all results
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        unique_results = dict(zip(unique, await self._check_routes_batch(list(unique.values()), timestamp)))
+        
+        results: List[Union[CongestionResult, BaseException]] = []
+        for key, route_config in zip(keys, route_configs):
+            result = unique_results[key]
+            if isinstance(result, CongestionResult) and result.route_name != route_config.name:
+                result = result.model_copy(update={"route_name": route_config.name})
+            results.append(result)
+        return results
+    
+    async def _check_routes_batch(
+        self,
+        route_configs: List[RouteConfig],
+        timestamp: Optional[str] = None
+    ) -> List[Union[CongestionResult, BaseException]]:
+        """Check routes with one batched fetch of their current and free-flow times.
+        
+        Identical requests (e.g. routes sharing endpoints and waypoints) are
+        only sent once, and cached free-flow times aren't requested at all;
+        congested routes then look up alternatives concurrently.
+        """
+        travel_times: Dict[Tuple[Any, ...], Union[float, BaseException]] = {}
+        requests: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        route_request_keys = []
+        for route_config in route_configs:
+            route_key = self._free_flow_key(route_config)
+            keys = []
+            for avoid_traffic in (False, True):
+                key = route_key + (avoid_traffic,)
+                if avoid_traffic and key not in travel_times:
+                    cached = self._get_cached_free_flow_time(route_key)
+                    if cached is not None:
+                        travel_times[key] = cached
+                if key not in travel_times:
+                    requests.setdefault(key, {
+                        "start": route_config.start_latlong,
+                        "end": route_config.end_latlong,
+                        "waypoints": route_config.free_flow_route or None,
+                        "avoid_traffic": avoid_traffic,
+                    })
+                keys.append(key)
+            route_request_keys.append(keys)
+        
+        responses = await self.api_client.get_routes_batch(list(requests.values()))
+        fetched_at = time.monotonic()
+        for key, response in zip(requests, responses):
+            if isinstance(response, BaseException):
+                travel_times[key] = response
+                continue
+            travel_times[key] = response.travel_time_minutes
+            if key[-1]:
+                self._free_flow_time_cache[key[:-1]] = (response.travel_time_minutes, fetched_at)
+        
+        async def evaluate(
+            route_config: RouteConfig,
+            current_key: Tuple[Any, ...],
+            free_flow_key: Tuple[Any, ...]
+        ) -> CongestionResult:
+            current, free_flow = travel_times[current_key], travel_times[free_flow_key]
+            if isinstance(current, BaseException):
+                raise current
+            if isinstance(free_flow, BaseException):
+                raise free_flow
+            return await self._evaluate_congestion(route_config, current, free_flow, timestamp)
+        
+        return await asyncio.gather(
+            *[evaluate(route_config, *keys) for route_config, keys in zip(route_configs, route_request_keys)],
+            return_exceptions=True
+        )
+    
+    async def _check_route_congestion_async(
+        self,
+        route_config: RouteConfig,
+        timestamp: Optional[str] = None
+    ) -> CongestionResult:
+        """Async implementation of congestion checking."""
         # Get current and free-flow travel times concurrently
         current_time_task = self.get_current_travel_time(route_config)
         free_flow_time_task = self.get_free_flow_travel_time(route_config)
@@ -81,6 +253,22 @@ class RouteMonitor:
             current_time_task, free_flow_time_task
         )
         
+        return await self._evaluate_congestion(
+            route_config, current_travel_time, free_flow_travel_time, timestamp
+        )
+    
+    async def _evaluate_congestion(
+        self,
+        route_config: RouteConfig,
+        current_travel_time: float,
+        free_flow_travel_time: float,
+        timestamp: Optional[str] = None
+    ) -> CongestionResult:
+        """Compare travel times and look for an alternative if the route is congested.
+        
+        Callers checking several routes at once pass a shared ``timestamp``;
+        otherwise the current time is used.
+        """
         # Calculate congestion ratio
         congestion_ratio = current_travel_time / free_flow_travel_time if free_flow_travel_time > 0 else 1.0
         is_congested = congestion_ratio > route_config.congestion_threshold
@@ -99,7 +287,8 @@ class RouteMonitor:
                 alternative_available = False
                 alternative_travel_time = None
         
-        return CongestionResult(
+        # All fields come from already-validated floats, so skip revalidation
+        return CongestionResult.model_construct(
             route_name=route_config.name,
             is_congested=is_congested,
             current_travel_time=current_travel_time,
@@ -107,7 +296,7 @@ class RouteMonitor:
             congestion_ratio=congestion_ratio,
             alternative_available=alternative_available,
             alternative_travel_time=alternative_travel_time,
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp or datetime.now().isoformat(timespec="seconds")
         )
     
     def get_optimal_route_waypoints(
@@ -116,7 +305,7 @@ class RouteMonitor:
         end: Tuple[float, float]
     ) -> List[Tuple[float, float]]:
         """Get waypoints for the optimal route between two points."""
-        return asyncio.run(self._get_optimal_route_waypoints_async(start, end))
+        return self._run(self._get_optimal_route_waypoints_async(start, end))
     
     async def _get_optimal_route_waypoints_async(
         self,
@@ -126,21 +315,23 @@ class RouteMonitor:
         """Async implementation of optimal route waypoint retrieval."""
         response = await self.api_client.get_optimal_route(start, end)
         
-        # Filter out start and end points, return intermediate waypoints
-        waypoints = response.waypoints
-        if len(waypoints) > 2:
+        # Filter out start and end points, return intermediate waypoints.
+        # Work on indices into the packed coordinate arrays so only the kept
+        # waypoints are materialized as tuples.
+        lats, lngs = response.coordinates
+        if len(lats) > 2:
             # Return waypoints excluding start and end
-            intermediate_waypoints = waypoints[1:-1]
+            indices = range(1, len(lats) - 1)
             
             # Limit waypoints to a reasonable number for API efficiency
             # Keep every nth waypoint to reduce total count while preserving route shape
             max_waypoints = 20  # Conservative limit below Mapbox's 25
-            if len(intermediate_waypoints) > max_waypoints:
+            if len(indices) > max_waypoints:
                 # Calculate step to downsample waypoints evenly
-                step = len(intermediate_waypoints) // max_waypoints
-                intermediate_waypoints = intermediate_waypoints[::step][:max_waypoints]
+                step = len(indices) // max_waypoints
+                indices = indices[::step][:max_waypoints]
             
-            return intermediate_waypoints
+            return [(lats[i], lngs[i]) for i in indices]
         else:
             # No intermediate waypoints
             return []
@@ -157,12 +348,7 @@ class RouteMonitor:
                 results = []
                 
                 # Check all routes concurrently
-                tasks = [
-                    self._check_route_congestion_async(route_config)
-                    for route_config in route_configs
-                ]
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                results = await self.check_routes_async(route_configs)
                 
                 # Process results
                 for i, result in enumerate(results):
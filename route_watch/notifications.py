@@ -1,10 +1,14 @@
 """Notification system for route_watch."""
 
+import asyncio
 import subprocess
-from typing import Optional
+from typing import List, Optional
 
 from route_watch.config import NotificationConfig
 
+# Seconds to wait for a notification command before giving up
+_COMMAND_TIMEOUT = 30
+
 
 class NotificationService:
     """Service for sending notifications via external CLI tools."""
@@ -12,6 +16,14 @@ class NotificationService:
     def __init__(self, config: Optional[NotificationConfig] = None):
         self.config = config
     
+    def refresh_env(self) -> None:
+        """Re-read environment variables referenced by the notification arguments.
+        
+        They are resolved once and cached; call this after changing them.
+        """
+        if self.config:
+            self.config.refresh_env()
+    
     def send_notification(self, message: str) -> bool:
         """Send a notification using the configured CLI tool.
         
@@ -21,38 +33,82 @@ class NotificationService:
         Returns:
             True if notification was sent successfully, False otherwise
         """
-        if not self.config:
-            print(f"No notification config - would send: {message}")
-            return False
-        
         try:
-            # Get command arguments with message substitution
-            command_args = [self.config.tool] + self.config.get_command_args(message)
+            command_args = self._command_args(message)
+            if command_args is None:
+                return False
             
-            # Execute the command
+            # Execute the command; stdout is unused and stderr only matters on failure
             result = subprocess.run(
                 command_args,
-                capture_output=True,
-                text=True,
-                timeout=30  # 30 second timeout
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=_COMMAND_TIMEOUT
             )
+        except Exception as e:
+            return self._report_error(e)
+        
+        return self._check_result(result.returncode, result.stderr)
+    
+    async def send_notification_async(self, message: str) -> bool:
+        """Send a notification without blocking the event loop.
+        
+        Behaves like send_notification, but runs the CLI tool as an asyncio
+        subprocess.
+        
+        Args:
+            message: The message to send
             
-            if result.returncode == 0:
-                return True
-            else:
-                print(f"Notification command failed with code {result.returncode}")
-                print(f"stderr: {result.stderr}")
+        Returns:
+            True if notification was sent successfully, False otherwise
+        """
+        try:
+            command_args = self._command_args(message)
+            if command_args is None:
                 return False
-                
-        except subprocess.TimeoutExpired:
+            
+            proc = await asyncio.create_subprocess_exec(
+                *command_args,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                _, stderr = await asyncio.wait_for(proc.communicate(), _COMMAND_TIMEOUT)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+        except Exception as e:
+            return self._report_error(e)
+        
+        return self._check_result(proc.returncode, stderr)
+    
+    def _command_args(self, message: str) -> Optional[List[str]]:
+        """Build the command line for a message, or None if not configured."""
+        if not self.config:
+            print(f"No notification config - would send: {message}")
+            return None
+        
+        # Get command arguments with message substitution
+        return [self.config.tool] + self.config.get_command_args(message)
+    
+    def _check_result(self, returncode: Optional[int], stderr: bytes) -> bool:
+        """Report a failed command; stderr is only decoded when it is printed."""
+        if returncode == 0:
+            return True
+        print(f"Notification command failed with code {returncode}")
+        print(f"stderr: {stderr.decode('utf-8', 'replace')}")
+        return False
+    
+    def _report_error(self, error: Exception) -> bool:
+        """Report an error raised while running the notification command."""
+        if isinstance(error, (subprocess.TimeoutExpired, asyncio.TimeoutError)):
             print("Notification command timed out")
-            return False
-        except FileNotFoundError:
+        elif isinstance(error, FileNotFoundError) and self.config:
             print(f"Notification tool '{self.config.tool}' not found")
-            return False
-        except Exception as e:
-            print(f"Error sending notification: {e}")
-            return False
+        else:
+            print(f"Error sending notification: {error}")
+        return False
     
     def test_notification(self) -> bool:
         """Test the notification system with a sample message.
@@ -75,6 +131,10 @@ class ConsoleNotificationService(NotificationService):
         """Print notification to console."""
         print(f"📱 NOTIFICATION: {message}")
         return True
+    
+    async def send_notification_async(self, message: str) -> bool:
+        """Print notification to console."""
+        return self.send_notification(message)
 
 
 # Convenience functions for common notification services
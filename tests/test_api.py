@@ -0,0 +1,194 @@
+"""Tests for API module."""
+
+import asyncio
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from route_watch.api import MapboxAPI, MockAPI, RouteResponse
+from route_watch.polyline import (
+    decode_polyline,
+    decode_polyline_arrays,
+    encode_polyline,
+    join_polylines,
+    polyline_length,
+)
+
+
+def mapbox_handler(request: httpx.Request) -> httpx.Response:
+    """Return a fixed two-point Mapbox route for any request."""
+    return httpx.Response(200, json={
+        "routes": [{
+            "duration": 600,
+            "distance": 5000,
+            "geometry": encode_polyline([(37.7749, -122.4194), (37.7831, -122.4031)])
+        }]
+    })
+
+
+def make_mapbox_api(requests=None) -> MapboxAPI:
+    """Create a MapboxAPI whose shared client uses a mock transport.
+
+    Every request sent is appended to ``requests`` when a list is given.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return mapbox_handler(request)
+
+    api = MapboxAPI("test_token")
+    api._client = httpx.AsyncClient(
+        base_url=api.base_url,
+        transport=httpx.MockTransport(handler)
+    )
+    return api
+
+
+def test_mapbox_reuses_client():
+    """Test that Mapbox requests share a single HTTP client."""
+    requests = []
+    api = make_mapbox_api(requests)
+    client = api._client
+
+    async def run():
+        first = await api.get_route((37.7749, -122.4194), (37.7831, -122.4031))
+        second = await api.get_route((37.7749, -122.4194), (37.7831, -122.4031))
+        assert api._client is client
+        await api.aclose()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.travel_time_minutes == 10
+    assert second.distance_km == 5
+    assert api._client is None
+    assert len(requests) == 2
+    assert requests[0].url.path.startswith("/directions/v5/mapbox/driving-traffic/")
+
+
+def test_mapbox_chunked_route():
+    """Test that long waypoint lists are split into stitched chunks."""
+    requests = []
+    api = make_mapbox_api(requests)
+    waypoints = [(37.0 + i / 100, -122.0) for i in range(30)]
+
+    result = asyncio.run(api.get_route((36.9, -122.0), (37.5, -122.0), waypoints))
+
+    paths = sorted((request.url.path for request in requests), key=len, reverse=True)
+    assert len(paths) == 2
+    first, second = (path.rsplit("/", 1)[1].split(";") for path in paths)
+    assert len(first) == 24
+    assert first[0] == "-122.0,36.9"
+    assert first[-1] == second[0] == "-122.0,37.22"
+    assert second[-1] == "-122.0,37.5"
+    assert result.travel_time_minutes == 20
+    assert result.distance_km == 10
+    assert len(result.waypoints) == 3
+
+
+def test_polyline_round_trip():
+    """Test polyline encoding against the reference example."""
+    points = [(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)]
+    encoded = encode_polyline(points, precision=5)
+    assert encoded == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+    assert decode_polyline(encoded, precision=5) == points
+    assert decode_polyline(encode_polyline(points)) == points
+    assert polyline_length(encoded) == 3
+
+    lats, lngs = decode_polyline_arrays(encoded, precision=5)
+    assert list(lats) == [38.5, 40.7, 43.252]
+    assert list(lngs) == [-120.2, -120.95, -126.453]
+
+    # Joined parts share their boundary point and match encoding in one go
+    parts = [encode_polyline(points[:2]), encode_polyline(points[1:])]
+    assert join_polylines(parts) == encode_polyline(points)
+
+
+def test_route_response_accepts_waypoints():
+    """Test that waypoints passed to RouteResponse are kept as its geometry."""
+    waypoints = [(37.7749, -122.4194), (37.7831, -122.4031)]
+    response = RouteResponse(travel_time_minutes=10, distance_km=5, waypoints=waypoints)
+    assert response.route_geometry == encode_polyline(waypoints)
+    assert response.waypoints == waypoints
+    assert RouteResponse.model_validate(response.model_dump()).waypoints == waypoints
+    assert RouteResponse(travel_time_minutes=10, distance_km=5).waypoints == []
+
+
+def test_route_response_geometry_is_not_stale():
+    """Test that decoded geometry follows route_geometry across copies."""
+    response = RouteResponse(
+        travel_time_minutes=10, distance_km=5, waypoints=[(37.7749, -122.4194), (37.7831, -122.4031)]
+    )
+    assert len(response.waypoints) == 2
+    assert len(response.coordinates[0]) == 2
+
+    copied = response.model_copy(update={"route_geometry": None})
+    assert copied.waypoints == []
+    assert len(copied.coordinates[0]) == 0
+
+    with pytest.raises(ValidationError):
+        response.route_geometry = None
+
+
+def test_optimal_route_cache():
+    """Test that free-flow routes are cached until the TTL expires."""
+    start, end = (37.7749, -122.4194), (37.8831, -122.3031)
+
+    async def run(api):
+        first = await api.get_optimal_route(start, end)
+        second = await api.get_optimal_route((37.774901, -122.4194), end)
+        return first, second
+
+    first, second = asyncio.run(run(MockAPI()))
+    assert first is second
+
+    first, second = asyncio.run(run(MockAPI(free_flow_cache_ttl=0)))
+    assert first is not second
+
+    # A refreshed entry moves to the back, so the stale one is evicted first
+    api = MockAPI(free_flow_cache_ttl=0)
+    api.free_flow_cache_size = 2
+    other = (37.7831, -122.4031)
+    asyncio.run(api.get_optimal_route(start, end))
+    asyncio.run(api.get_optimal_route(start, other))
+    asyncio.run(api.get_optimal_route(start, end))
+    asyncio.run(api.get_optimal_route(end, other))
+    assert len(api._free_flow_cache) == 2
+    assert (round(start[0], 5), round(start[1], 5), end[0], end[1]) in api._free_flow_cache
+
+
+def test_get_routes_batch():
+    """Test that batched routes keep request order and capture errors."""
+    api = MockAPI()
+    requests = [
+        {"start": (37.7749, -122.4194), "end": (37.7831, -122.4031)},
+        {"start": (37.7749, -122.4194), "end": (37.7831, -122.4031), "avoid_traffic": True},
+        {"start": (37.7749, -122.4194)},
+    ]
+
+    results = asyncio.run(api.get_routes_batch(requests))
+
+    assert results[0].travel_time_minutes == 45
+    assert results[1].travel_time_minutes == 30
+    assert isinstance(results[1].travel_time_minutes, float)
+    assert isinstance(results[2], TypeError)
+
+
+def test_identical_inflight_requests_are_coalesced():
+    """Test that concurrent identical route requests share one HTTP call."""
+    requests = []
+    api = make_mapbox_api(requests)
+    start, end = (37.7749, -122.4194), (37.7831, -122.4031)
+
+    async def run():
+        return await asyncio.gather(
+            api.get_route(start, end),
+            api.get_route(start, end),
+            api.get_route(start, end, avoid_traffic=True),
+        )
+
+    first, second, third = asyncio.run(run())
+    assert first is second
+    assert third is not first
+    assert len(requests) == 2
+    assert api._inflight == {}
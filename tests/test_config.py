@@ -1,7 +1,9 @@
 """Tests for configuration module."""
 
+from datetime import datetime
+
 import pytest
-from route_watch.config import RouteConfig, NotificationConfig, Config
+from route_watch.config import RouteConfig, NotificationConfig, Config, _load_config
 
 
 def test_route_config_validation():
@@ -51,6 +53,12 @@ def test_notification_config():
         assert "Test message" in args
         assert "test_token" in args
         
+        # Environment variables are resolved once until refreshed
+        os.environ["TELEGRAM_BOT_TOKEN"] = "new_token"
+        assert "test_token" in config.get_command_args("Another message")
+        config.refresh_env()
+        assert "new_token" in config.get_command_args("Another message")
+        
     finally:
         # Clean up
         os.environ.pop("TELEGRAM_BOT_TOKEN", None)
@@ -64,4 +72,130 @@ def test_config_model():
     
     # Test route getter
     with pytest.raises(ValueError, match="Route 'nonexistent' not found"):
-        config.get_route("nonexistent")
\ No newline at end of file
+        config.get_route("nonexistent")
+
+
+def test_config_cache(tmp_path, monkeypatch):
+    """Test that parsed configurations are cached when enabled."""
+    config_file = tmp_path / "routes.toml"
+    config_file.write_text(
+        'provider = "mock"\n'
+        '[route.home]\n'
+        'name = "Home"\n'
+        'start_latlong = [37.7749, -122.4194]\n'
+        'end_latlong = [37.7831, -122.4031]\n'
+    )
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+
+    # Disabled by default
+    monkeypatch.delenv("ROUTE_WATCH_CONFIG_CACHE", raising=False)
+    Config.load_from_file(config_file)
+    assert not cache_home.exists()
+
+    monkeypatch.setenv("ROUTE_WATCH_CONFIG_CACHE", "1")
+    _load_config.cache_clear()
+    config = Config.load_from_file(config_file)
+    cache_files = list((cache_home / "route_watch").glob("*.json"))
+    assert len(cache_files) == 1
+
+    _load_config.cache_clear()
+    cached = Config.load_from_file(config_file)
+    assert cached == config
+    assert cached.get_route("home").start_latlong == (37.7749, -122.4194)
+
+    # Editing the file produces a new cache entry
+    config_file.write_text(config_file.read_text().replace("Home", "Office"))
+    assert Config.load_from_file(config_file).get_route("home").name == "Office"
+    assert len(list((cache_home / "route_watch").glob("*.json"))) == 2
+
+    # Configs that JSON can't represent exactly are not cached
+    config_file.write_text(config_file.read_text() + "congestion_threshold = inf\n")
+    assert Config.load_from_file(config_file).get_route("home").congestion_threshold == float("inf")
+    assert len(list((cache_home / "route_watch").glob("*.json"))) == 2
+
+
+def test_load_from_file_returns_fresh_instances(tmp_path):
+    """Test that memoized loads don't share mutable state."""
+    config_file = tmp_path / "routes.json"
+    config_file.write_text(
+        '{"route": {"home": {"name": "Home", '
+        '"start_latlong": [37.7749, -122.4194], "end_latlong": [37.7831, -122.4031]}}}'
+    )
+
+    first = Config.load_from_file(config_file)
+    first.get_route("home").free_flow_route = [(37.78, -122.41)]
+
+    second = Config.load_from_file(config_file)
+    assert second.get_route("home").free_flow_route == []
+    assert first is not second
+
+
+def test_load_from_file_keeps_non_json_values(tmp_path):
+    """Test that memoized loads don't lose values JSON can't represent."""
+    config_file = tmp_path / "routes.toml"
+    config_file.write_text(
+        'started = 2024-01-01T08:00:00\n'
+        '[route.home]\n'
+        'name = "Home"\n'
+        'start_latlong = [37.7749, -122.4194]\n'
+        'end_latlong = [37.7831, -122.4031]\n'
+        'congestion_threshold = inf\n'
+    )
+
+    for _ in range(2):
+        config = Config.load_from_file(config_file)
+        assert config.get_route("home").congestion_threshold == float("inf")
+        assert isinstance(config.api_config["started"], datetime)
+
+
+@pytest.mark.parametrize("suffix", [".toml", ".yaml", ".json"])
+@pytest.mark.parametrize("threshold", [1.5, float("inf")])
+def test_save_and_reload(tmp_path, suffix, threshold):
+    """Test that saved configurations load back unchanged."""
+    config = Config(
+        routes={
+            "home": RouteConfig(
+                name="Home",
+                start_latlong=(37.7749, -122.4194),
+                end_latlong=(37.7831, -122.4031),
+                free_flow_route=[(37.775, -122.42), (37.78, -122.41)],
+                congestion_threshold=threshold
+            )
+        },
+        notification=NotificationConfig(tool="echo", cli_args=["_NOTIFICATION_MESSAGE_"]),
+        api_config={"provider": "mock"}
+    )
+    config_file = tmp_path / f"routes{suffix}"
+
+    config.save_to_file(config_file)
+
+    assert Config.load_from_file(config_file) == config
+
+
+@pytest.mark.parametrize("content", [
+    '# TOML\nprovider = "mock"\n[route.home]\nname = "Home"\n'
+    'start_latlong = [37.7749, -122.4194]\nend_latlong = [37.7831, -122.4031]\n',
+    '# YAML\nprovider: mock\nroute:\n  home:\n    name: Home\n'
+    '    start_latlong: [37.7749, -122.4194]\n    end_latlong: [37.7831, -122.4031]\n',
+    '{"provider": "mock", "route": {"home": {"name": "Home", '
+    '"start_latlong": [37.7749, -122.4194], "end_latlong": [37.7831, -122.4031]}}}',
+])
+def test_load_unknown_extension(tmp_path, content):
+    """Test format detection for files without a known extension."""
+    config_file = tmp_path / "routes.cfg"
+    config_file.write_text(content)
+
+    config = Config.load_from_file(config_file)
+
+    assert config.api_config == {"provider": "mock"}
+    assert config.get_route("home").name == "Home"
+
+
+def test_load_unparseable_file(tmp_path):
+    """Test that unparseable files without a known extension are rejected."""
+    config_file = tmp_path / "routes.cfg"
+    config_file.write_text("provider = = mock\n")
+
+    with pytest.raises(ValueError, match="Unable to parse configuration file"):
+        Config.load_from_file(config_file)
@@ -0,0 +1,130 @@
+"""Tests for core monitoring module."""
+
+import asyncio
+
+from route_watch.config import RouteConfig
+from route_watch.core import CongestionResult, RouteMonitor
+
+
+def route(**overrides) -> RouteConfig:
+    """Build a short test route, overriding any field by keyword."""
+    fields = {
+        "name": "Test",
+        "start_latlong": (37.7749, -122.4194),
+        "end_latlong": (37.7831, -122.4031),
+    }
+    fields.update(overrides)
+    return RouteConfig(**fields)
+
+
+def record_calls(monkeypatch, obj, name):
+    """Wrap the async method ``obj.name`` and return the list of its calls.
+
+    Each call is recorded as an ``(args, kwargs)`` pair before being passed
+    through to the original method.
+    """
+    calls = []
+    method = getattr(obj, name)
+
+    async def recording(*args, **kwargs):
+        calls.append((args, kwargs))
+        return await method(*args, **kwargs)
+
+    monkeypatch.setattr(obj, name, recording)
+    return calls
+
+
+def test_check_routes():
+    """Test checking several routes concurrently."""
+    monitor = RouteMonitor({"provider": "mock"})
+    routes = [
+        route(name="Congested", congestion_threshold=1.3),
+        route(name="Clear", congestion_threshold=1.6),
+    ]
+
+    results = monitor.check_routes(routes)
+
+    assert all(isinstance(result, CongestionResult) for result in results)
+    assert [result.route_name for result in results] == ["Congested", "Clear"]
+    assert results[0].is_congested
+    assert not results[1].is_congested
+    assert results[0].congestion_ratio == 1.5
+    assert results[0].timestamp == results[1].timestamp
+    assert isinstance(results[1].free_flow_travel_time, float)
+
+
+def test_alternative_travel_time_cache(monkeypatch):
+    """Test that alternative routes are reused within a time bucket."""
+    monitor = RouteMonitor({"provider": "mock"})
+    test_route = route()
+    calls = record_calls(monkeypatch, monitor.api_client, "get_route")
+    now = 1_000_000.0
+    monkeypatch.setattr("route_watch.core.time.time", lambda: now)
+
+    first = asyncio.run(monitor.get_alternative_travel_time(test_route))
+    second = asyncio.run(monitor.get_alternative_travel_time(test_route))
+    assert first == second
+    assert len(calls) == 1
+
+    now += monitor.alternative_cache_seconds
+    asyncio.run(monitor.get_alternative_travel_time(test_route))
+    assert len(calls) == 2
+    assert len(monitor._alternative_cache) == 1
+
+
+def test_check_routes_deduplicates_identical_routes(monkeypatch):
+    """Test that routes differing only by name are checked once."""
+    monitor = RouteMonitor({"provider": "mock"})
+    routes = [route(name=name) for name in ("Home", "Office", "Home again")]
+    calls = record_calls(monkeypatch, monitor.api_client, "get_route")
+
+    results = monitor.check_routes(routes)
+
+    assert [result.route_name for result in results] == ["Home", "Office", "Home again"]
+    assert len({result.congestion_ratio for result in results}) == 1
+    assert len(calls) == 2
+
+
+def test_check_routes_batches_shared_requests(monkeypatch):
+    """Test that routes sharing endpoints share one batched fetch."""
+    monitor = RouteMonitor({"provider": "mock"})
+    routes = [
+        route(name=f"Route {threshold}", congestion_threshold=threshold)
+        for threshold in (1.3, 1.6)
+    ]
+    calls = record_calls(monkeypatch, monitor.api_client, "get_routes_batch")
+
+    results = monitor.check_routes(routes)
+
+    assert len(calls) == 1
+    (requests,), _ = calls[0]
+    assert [request["avoid_traffic"] for request in requests] == [False, True]
+    assert [result.is_congested for result in results] == [True, False]
+
+
+def test_free_flow_time_cache(monkeypatch):
+    """Test that free-flow times are only requested once per TTL."""
+    monitor = RouteMonitor({"provider": "mock"})
+    test_route = route()
+    calls = record_calls(monkeypatch, monitor.api_client, "get_routes_batch")
+
+    def last_batch():
+        (requests,), _ = calls[-1]
+        return [request["avoid_traffic"] for request in requests]
+
+    first = monitor.check_routes([test_route])[0]
+    assert last_batch() == [False, True]
+    second = monitor.check_routes([test_route])[0]
+    assert last_batch() == [False]
+    assert len(calls) == 2
+    assert second.free_flow_travel_time == first.free_flow_travel_time
+
+    # Changing the waypoints invalidates the cached time
+    test_route.free_flow_route = [(37.78, -122.41)]
+    monitor.check_routes([test_route])
+    assert last_batch() == [False, True]
+
+    assert RouteMonitor({"provider": "mock", "free_flow_time_ttl": 600}).free_flow_time_ttl == 600
+    monitor.free_flow_time_ttl = 0
+    monitor.check_routes([test_route])
+    assert last_batch() == [False, True]
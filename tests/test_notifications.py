@@ -0,0 +1,69 @@
+"""Tests for notifications module."""
+
+import asyncio
+import sys
+
+from route_watch import notifications
+from route_watch.config import NotificationConfig
+from route_watch.notifications import ConsoleNotificationService, NotificationService
+
+
+def python_service(code: str) -> NotificationService:
+    """Create a service whose tool runs a Python snippet with the message as argv[1]."""
+    return NotificationService(NotificationConfig(
+        tool=sys.executable,
+        cli_args=["-c", code, "_NOTIFICATION_MESSAGE_"]
+    ))
+
+
+def test_send_notification_async_success(tmp_path):
+    """Test that a successful command passes the message and returns True."""
+    output = tmp_path / "message.txt"
+    service = python_service(f"import sys; open({str(output)!r}, 'w').write(sys.argv[1])")
+
+    assert asyncio.run(service.send_notification_async("Traffic alert"))
+    assert output.read_text() == "Traffic alert"
+
+
+def test_send_notification_async_failure_reports_stderr(capsys):
+    """Test that a failing command reports its exit code and stderr."""
+    service = python_service("import sys; sys.stderr.write('oops'); sys.exit(3)")
+
+    assert not asyncio.run(service.send_notification_async("Traffic alert"))
+    output = capsys.readouterr().out
+    assert "failed with code 3" in output
+    assert "stderr: oops" in output
+
+
+def test_send_notification_async_timeout_kills_process(monkeypatch, capsys):
+    """Test that a hung command is killed once the timeout expires."""
+    monkeypatch.setattr(notifications, "_COMMAND_TIMEOUT", 0.2)
+    processes = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def recording_create_subprocess_exec(*args, **kwargs):
+        process = await create_subprocess_exec(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_create_subprocess_exec)
+    service = python_service("import time; time.sleep(30)")
+
+    assert not asyncio.run(service.send_notification_async("Traffic alert"))
+    assert "timed out" in capsys.readouterr().out
+    assert len(processes) == 1
+    assert processes[0].returncode is not None and processes[0].returncode != 0
+
+
+def test_send_notification_async_missing_tool(capsys):
+    """Test that a missing notification tool is reported, not raised."""
+    service = NotificationService(NotificationConfig(tool="route_watch_missing_tool", cli_args=[]))
+
+    assert not asyncio.run(service.send_notification_async("Traffic alert"))
+    assert "'route_watch_missing_tool' not found" in capsys.readouterr().out
+
+
+def test_console_notification_async(capsys):
+    """Test that the console service prints notifications from async callers too."""
+    assert asyncio.run(ConsoleNotificationService().send_notification_async("Traffic alert"))
+    assert "NOTIFICATION: Traffic alert" in capsys.readouterr().out